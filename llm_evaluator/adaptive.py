@@ -0,0 +1,276 @@
+from dataclasses import dataclass, asdict
+from statistics import NormalDist
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import math
+import random
+from .config import Config
+from .evaluator import LLMEvaluator
+from .data.loader import DatasetLoader
+
+logging.basicConfig(level=Config.LOG_LEVEL)
+
+# The bundled CSVs hold no tool-call traces, so generated text cannot be scored for these
+UNSCORABLE_DIMENSIONS = {"tool_calling_performance"}
+
+
+def t_quantile(p: float, df: int) -> float:
+    """Quantile of Student's t distribution with ``df`` degrees of freedom"""
+    if df > 100:
+        # Cornish-Fisher expansion around the normal quantile
+        z = NormalDist().inv_cdf(p)
+        return (z + (z ** 3 + z) / (4 * df)
+                + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+                + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+
+    def cdf(t: float) -> float:
+        # Closed form for integer degrees of freedom (Abramowitz & Stegun 26.7.3-4)
+        theta = math.atan(t / math.sqrt(df))
+        cos2 = math.cos(theta) ** 2
+        if df % 2:
+            term, total = 1.0, 1.0 if df > 1 else 0.0
+            for k in range(3, df - 1, 2):
+                term *= cos2 * (k - 1) / k
+                total += term
+            a = 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+        else:
+            term, total = 1.0, 1.0
+            for k in range(2, df - 1, 2):
+                term *= cos2 * (k - 1) / k
+                total += term
+            a = math.sin(theta) * total
+        return (1 + a) / 2
+
+    low, high = 0.0, 1.0
+    while cdf(high) < p:
+        low, high = high, high * 2
+    for _ in range(100):
+        mid = (low + high) / 2
+        if cdf(mid) < p:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+class RunningStats:
+    """Running mean and variance (Welford) of [0, 1] scores with a Student-t interval.
+
+    The sample variance is floored at ``variance_floor`` so a run of
+    identical scores still yields a margin of nonzero width. Below two
+    samples the interval is the whole [0, 1] range.
+    """
+
+    def __init__(
+            self,
+            confidence: float = Config.ADAPTIVE_CONFIDENCE,
+            variance_floor: float = Config.ADAPTIVE_VARIANCE_FLOOR
+    ):
+        self.confidence = confidence
+        self.variance_floor = variance_floor
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        value = min(1.0, max(0.0, value))
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.count else None
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return math.inf
+        return max(self._m2 / (self.count - 1), self.variance_floor)
+
+    @property
+    def half_width(self) -> float:
+        if self.count < 2:
+            return math.inf
+        t = t_quantile(0.5 + self.confidence / 2, self.count - 1)
+        return t * math.sqrt(self.variance / self.count)
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        if self.count < 2:
+            return 0.0, 1.0
+        half_width = self.half_width
+        return max(0.0, self._mean - half_width), min(1.0, self._mean + half_width)
+
+    @property
+    def margin(self) -> float:
+        """Largest distance from the mean to either end of the interval"""
+        if self.count < 2:
+            return 1.0
+        low, high = self.interval
+        return max(self._mean - low, high - self._mean)
+
+
+@dataclass
+class DimensionReport:
+    score: Optional[float]
+    ci_low: float
+    ci_high: float
+    rows_evaluated: int
+    rows_available: int
+    stop_reason: str
+
+
+class AdaptiveEvaluator:
+    """Evaluate dimension CSVs on a random, stratified subset of rows.
+
+    Rows of each dimension are scored one at a time until the ± margin of
+    the running mean's confidence interval is below ``tolerance``, the
+    per-dimension budget of ``max_calls`` model calls is spent, or the
+    dataset is exhausted. ``confidence`` is the joint level across all
+    evaluated dimensions: each one is run at a Bonferroni-corrected level.
+    Rows are stratified by ``strata_column`` when given, otherwise by
+    ``length_buckets`` quantiles of the input length.
+    """
+
+    def __init__(
+            self,
+            generate: Callable[[str], str],
+            evaluator: Optional[LLMEvaluator] = None,
+            loader: Optional[DatasetLoader] = None,
+            tolerance: float = Config.ADAPTIVE_TOLERANCE,
+            confidence: float = Config.ADAPTIVE_CONFIDENCE,
+            variance_floor: float = Config.ADAPTIVE_VARIANCE_FLOOR,
+            min_samples: int = Config.ADAPTIVE_MIN_SAMPLES,
+            max_calls: int = Config.ADAPTIVE_MAX_CALLS,
+            strata_column: Optional[str] = None,
+            length_buckets: int = 4,
+            seed: Optional[int] = None
+    ):
+        self.generate = generate
+        self.evaluator = evaluator or LLMEvaluator()
+        self.loader = loader or DatasetLoader()
+        self.tolerance = tolerance
+        self.confidence = confidence
+        self.variance_floor = variance_floor
+        self.min_samples = max(2, min_samples)
+        self.max_calls = max_calls
+        self.strata_column = strata_column
+        self.length_buckets = max(1, length_buckets)
+        self.rng = random.Random(seed)
+        self.logger = logging.getLogger(__name__)
+
+    def strata(self, df) -> List[List]:
+        """Group row indices by ``strata_column`` or by input-length quantile"""
+        if self.strata_column is not None:
+            if self.strata_column not in df.columns:
+                raise ValueError(f"Strata column '{self.strata_column}' not found in dataset.")
+            # dropna=False keeps rows with a missing stratum value in their own stratum
+            grouped = df.groupby(self.strata_column, sort=False, dropna=False)
+            return [list(group.index) for _, group in grouped]
+
+        ranks = df["input_text"].astype(str).str.len().rank(method="first")
+        buckets = {}
+        for row_id, rank in ranks.items():
+            bucket = int((rank - 1) * self.length_buckets // len(df))
+            buckets.setdefault(bucket, []).append(row_id)
+        return list(buckets.values())
+
+    def sample_order(self, df) -> List:
+        """Shuffle rows within each stratum and interleave strata round-robin"""
+        groups = self.strata(df)
+        for group in groups:
+            self.rng.shuffle(group)
+        self.rng.shuffle(groups)
+
+        order = []
+        for position in range(max((len(g) for g in groups), default=0)):
+            order.extend(g[position] for g in groups if position < len(g))
+        return order
+
+    @staticmethod
+    def build_conversation(dimension: str, row, response: str) -> Dict:
+        """Build the conversation fields the metric for ``dimension`` reads"""
+        conversation = {
+            "text": response,
+            "response": response,
+            "input_text": row["input_text"],
+            "expected_output": row["reference"]
+        }
+        if dimension == "edge_case_handling":
+            conversation["is_edge_case"] = True
+        elif dimension == "special_instruction_adherence":
+            conversation["instructions"] = row["input_text"]
+        return conversation
+
+    def evaluate_dimension(self, dimension: str, confidence: Optional[float] = None) -> DimensionReport:
+        """Adaptively evaluate one dimension against its bundled CSV"""
+        df = self.loader.get_dataset(Config.DIMENSION_DATASETS[dimension])
+        stats = RunningStats(confidence or self.confidence, self.variance_floor)
+
+        if dimension in UNSCORABLE_DIMENSIONS:
+            self.logger.warning(f"{dimension}: bundled CSV cannot be scored, skipping")
+            return DimensionReport(None, 0.0, 1.0, 0, len(df), "unscorable")
+
+        stop_reason = "exhausted"
+        for row_id in self.sample_order(df):
+            if stats.count >= self.max_calls:
+                stop_reason = "budget"
+                break
+            row = df.loc[row_id]
+            response = self.generate(row["input_text"])
+            conversation = self.build_conversation(dimension, row, response)
+            stats.add(self.evaluator.evaluate_dimension(conversation, dimension))
+            if stats.count >= self.min_samples and stats.margin < self.tolerance:
+                stop_reason = "converged"
+                break
+
+        ci_low, ci_high = stats.interval
+        score = stats.mean
+        self.logger.info(
+            f"{dimension}: {'n/a' if score is None else f'{score:.3f}'} "
+            f"[{ci_low:.3f}, {ci_high:.3f}] after {stats.count}/{len(df)} rows ({stop_reason})"
+        )
+        return DimensionReport(
+            score=score,
+            ci_low=ci_low,
+            ci_high=ci_high,
+            rows_evaluated=stats.count,
+            rows_available=len(df),
+            stop_reason=stop_reason
+        )
+
+    def evaluate(self, dimensions: Optional[List[str]] = None) -> Dict:
+        """Adaptively evaluate all dimensions and report the weighted final score"""
+        dimensions = dimensions or Config.EVALUATION_DIMENSIONS
+        # Bonferroni: if each of k intervals fails with probability alpha / k,
+        # all of them hold together with probability at least 1 - alpha
+        scorable = [d for d in dimensions if d not in UNSCORABLE_DIMENSIONS]
+        dimension_confidence = 1 - (1 - self.confidence) / max(len(scorable), 1)
+        reports = {
+            dimension: self.evaluate_dimension(dimension, dimension_confidence)
+            for dimension in dimensions
+        }
+
+        # Dimensions without any evaluated rows are missing, not zero
+        scored = {dimension: r for dimension, r in reports.items() if r.score is not None}
+        scores = {dimension: r.score for dimension, r in scored.items()}
+        final_score = self.evaluator.scorer.compute_weighted_score(scores) if scores else None
+        # While every interval holds, the weighted mean's error is at most the
+        # weighted mean of the per-dimension margins
+        margins = {
+            dimension: max(r.score - r.ci_low, r.ci_high - r.score)
+            for dimension, r in scored.items()
+        }
+        final_margin = self.evaluator.scorer.compute_weighted_score(margins) if margins else None
+
+        return {
+            "dimensions": {dimension: asdict(report) for dimension, report in reports.items()},
+            "final_score": final_score,
+            "final_score_margin": final_margin,
+            "confidence": self.confidence,
+            "dimension_confidence": dimension_confidence,
+            "rows_evaluated": sum(r.rows_evaluated for r in reports.values()),
+            "rows_available": sum(r.rows_available for r in reports.values())
+        }
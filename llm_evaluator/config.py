@@ -27,5 +27,31 @@ class Config:
         "task_execution_accuracy": 0.15
     }
 
+    # Bundled CSV dataset backing each dimension (see llm_evaluator/data/csv)
+    DIMENSION_DATASETS = {
+        "conversation_fluency": "conversation_fluency",
+        "tool_calling_performance": "tool_calling",
+        "guardrails_compliance": "guardrails_compliance",
+        "edge_case_handling": "edge_case_handling",
+        "special_instruction_adherence": "special_instruction_adherence",
+        "language_proficiency": "language_proficiency",
+        "task_execution_accuracy": "task_execution"
+    }
+
+    # Adaptive evaluation: stop a dimension once the ± margin of its confidence
+    # interval is below the tolerance or its model-call budget is spent.
+    # The confidence level is joint across all evaluated dimensions.
+    ADAPTIVE_TOLERANCE = float(os.getenv("ADAPTIVE_TOLERANCE", 0.1))
+    ADAPTIVE_CONFIDENCE = float(os.getenv("ADAPTIVE_CONFIDENCE", 0.95))
+    # Lower bound on the sample variance so identical scores keep a nonzero margin
+    ADAPTIVE_VARIANCE_FLOOR = float(os.getenv("ADAPTIVE_VARIANCE_FLOOR", 0.01))
+    ADAPTIVE_MIN_SAMPLES = int(os.getenv("ADAPTIVE_MIN_SAMPLES", 5))
+    ADAPTIVE_MAX_CALLS = int(os.getenv("ADAPTIVE_MAX_CALLS", 200))
+
+    # TranslationModel inference backend: "torch" (fp32), or the CPU-optimized
+    # "int8" and "onnx" backends whose converted models are cached on disk
+    TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "torch")
+    TRANSLATION_CACHE_DIR = os.getenv("TRANSLATION_CACHE_DIR", "models/translation")
+
 # Ensure output directory exists
 os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
@@ -1,4 +1,5 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 import re
 import logging
 from .config import Config
@@ -35,4 +36,75 @@ class Guardrails:
             if not required:
                 score -= 0.2
                 
-        return max(0.0, min(1.0, score))
\ No newline at end of file
+        return max(0.0, min(1.0, score))
+
+
+@dataclass
+class GuardrailViolation:
+    """A forbidden phrase confirmed in a generation stream."""
+    phrase: str
+    matched_text: str
+    offset: int
+
+
+class StreamingGuardrails:
+    """Incremental forbidden-phrase matcher over a stream of text chunks.
+
+    Only the last ``window - 1`` characters seen are carried between chunks,
+    so a phrase split across chunk boundaries is still matched while each
+    chunk is scanned once. ``window`` defaults to the longest forbidden
+    phrase, which covers the literal patterns used by ``Guardrails``.
+    """
+
+    def __init__(self, guardrails: Optional[Guardrails] = None, window: Optional[int] = None):
+        self.guardrails = guardrails or Guardrails()
+        self.logger = logging.getLogger(__name__)
+        self.patterns = [
+            (phrase, re.compile(phrase, re.IGNORECASE))
+            for phrase in self.guardrails.forbidden_phrases
+        ]
+        self.window = window or max((len(p) for p in self.guardrails.forbidden_phrases), default=1)
+        self.reset()
+
+    def reset(self):
+        """Clear all stream state so the matcher can be reused"""
+        self.chunks: List[str] = []
+        self.violations: List[GuardrailViolation] = []
+        self._tail = ""
+        self._consumed = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    @property
+    def violated(self) -> bool:
+        return bool(self.violations)
+
+    def feed(self, chunk: str) -> Optional[GuardrailViolation]:
+        """Consume one chunk and return the first violation it completes, if any"""
+        if not chunk:
+            return None
+        self.chunks.append(chunk)
+        buffer = self._tail + chunk
+        buffer_start = self._consumed - len(self._tail)
+
+        found = []
+        for phrase, pattern in self.patterns:
+            for match in pattern.finditer(buffer):
+                # Matches ending inside the carried tail were reported by an earlier chunk
+                if match.end() > len(self._tail):
+                    found.append(GuardrailViolation(phrase, match.group(0), buffer_start + match.start()))
+        found.sort(key=lambda v: v.offset)
+        for violation in found:
+            self.logger.warning(f"Forbidden phrase detected at offset {violation.offset}: {violation.phrase}")
+        self.violations.extend(found)
+
+        self._consumed += len(chunk)
+        keep = self.window - 1
+        self._tail = buffer[-keep:] if keep > 0 else ""
+        return found[0] if found else None
+
+    def score(self) -> float:
+        """Score the text streamed so far with the batch compliance check"""
+        return self.guardrails.check_compliance({'text': self.text})
@@ -2,11 +2,13 @@ import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from langchain_community.llms import LlamaCpp
 from huggingface_hub import hf_hub_download
 import torch
 
+from ..guardrails import GuardrailViolation, StreamingGuardrails
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -116,6 +118,51 @@ class LlamaModel:
             raise RuntimeError(f"Generation failed: {str(e)}")
 
 
+    def generate_stream(
+            self, prompt: str, guardrails: Optional[StreamingGuardrails] = None
+    ) -> Tuple[str, Optional[GuardrailViolation]]:
+        """
+        Stream a response for a given prompt, aborting on the first guardrail violation.
+
+        Args:
+            prompt (str): Input prompt for the model.
+            guardrails (Optional[StreamingGuardrails]): Matcher fed with each streamed chunk.
+                A fresh matcher is created if not provided.
+
+        Returns:
+            Tuple[str, Optional[GuardrailViolation]]: Text generated up to the point of
+                stopping, and the violation that stopped generation (None if it completed).
+
+        Raises:
+            ValueError: If the prompt is empty or invalid.
+            RuntimeError: If generation fails.
+        """
+        if not isinstance(prompt, str) or not prompt.strip():
+            logger.error("Invalid prompt: must be a non-empty string")
+            raise ValueError("Prompt must be a non-empty string")
+
+        matcher = guardrails or StreamingGuardrails()
+        matcher.reset()
+        violation = None
+        try:
+            stream = self.llm.stream(prompt)
+            try:
+                for chunk in stream:
+                    violation = matcher.feed(chunk)
+                    if violation is not None:
+                        logger.warning(f"Generation aborted at offset {violation.offset}")
+                        break
+            finally:
+                # Closing the generator stops llama.cpp from producing further tokens
+                stream.close()
+        except Exception as e:
+            logger.error(f"Generation failed: {str(e)}")
+            raise RuntimeError(f"Generation failed: {str(e)}")
+
+        logger.info("Successfully streamed response")
+        return matcher.text, violation
+
+
 def get_chat_prompt(user_input: str) -> str:
     """
     Create a formatted chat prompt with system instructions and user input.
@@ -1,10 +1,18 @@
 import requests
-from typing import Dict
+from dataclasses import asdict
+from itertools import chain
+from typing import Dict, Iterator, Optional, Tuple
+import codecs
+import json
 import logging
 from ..config import Config
+from ..guardrails import StreamingGuardrails
 
 logging.basicConfig(level=Config.LOG_LEVEL)
 
+SSE_TYPES = ("text/event-stream",)
+JSON_LINES_TYPES = ("application/x-ndjson", "application/jsonl", "application/json")
+
 class LLMApi:
     def __init__(self, endpoint: str = Config.MODEL_API_ENDPOINT):
         self.endpoint = endpoint
@@ -23,4 +31,103 @@ class LLMApi:
         except requests.RequestException as e:
             self.logger.error(f"API request failed: {e}")
             return {"error": str(e)}
-        
\ No newline at end of file
+
+    def stream_response(self, prompt: str, guardrails: Optional[StreamingGuardrails] = None) -> Dict:
+        """Stream response from LLM API, closing the connection on the first guardrail violation"""
+        matcher = guardrails or StreamingGuardrails()
+        matcher.reset()
+        violation = None
+        try:
+            with requests.post(
+                self.endpoint,
+                json={"prompt": prompt, "stream": True},
+                timeout=10,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                for delta in self._iter_stream_text(response):
+                    violation = matcher.feed(delta)
+                    if violation is not None:
+                        self.logger.warning(f"Stream aborted at offset {violation.offset}")
+                        break
+        except requests.RequestException as e:
+            self.logger.error(f"API request failed: {e}")
+            return {"error": str(e)}
+        return {
+            "text": matcher.text,
+            "aborted": violation is not None,
+            "violation": asdict(violation) if violation else None
+        }
+
+    @staticmethod
+    def _parse_content_type(content_type: str) -> Tuple[str, str]:
+        """Split a Content-Type header into its MIME type and charset (UTF-8 unless explicit)"""
+        mime, _, params = content_type.partition(";")
+        charset = "utf-8"
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip('"\'')
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            charset = "utf-8"
+        return mime.strip().lower(), charset
+
+    def _iter_stream_text(self, response) -> Iterator[str]:
+        """Yield decoded text deltas as they arrive, unwrapping SSE or JSON-lines framing"""
+        mime, charset = self._parse_content_type(response.headers.get("Content-Type", ""))
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        texts = chain(
+            (decoder.decode(chunk) for chunk in response.iter_content(chunk_size=None)),
+            (decoder.decode(b"", final=True),)
+        )
+
+        if mime not in SSE_TYPES + JSON_LINES_TYPES:
+            # Unframed text is matched chunk by chunk, without waiting for newlines
+            for text in texts:
+                if text:
+                    yield text
+            return
+
+        is_sse = mime in SSE_TYPES
+        buffer = ""
+        for text in chain(texts, ("\n",)):
+            buffer += text
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                line = line.rstrip("\r")
+                if not line.strip():
+                    continue
+                if is_sse:
+                    if not line.startswith("data:"):
+                        continue
+                    line = line[len("data:"):].strip()
+                    if line == "[DONE]":
+                        return
+                delta = self._decode_stream_line(line)
+                if delta:
+                    yield delta
+
+    @staticmethod
+    def _decode_stream_line(line: str) -> str:
+        """Extract the text delta from one JSON-lines or SSE payload"""
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            # Not JSON: the line itself is text, and framing stripped its newline
+            return line + "\n"
+        if isinstance(payload, str):
+            return payload
+        if not isinstance(payload, dict):
+            return line + "\n"
+        choices = payload.get("choices")
+        if choices:
+            choice = choices[0]
+            delta = choice.get("delta") or {}
+            return delta.get("content") or choice.get("text") or ""
+        for key in ("response", "text", "token", "content", "delta"):
+            value = payload.get(key)
+            if isinstance(value, str):
+                return value
+        return ""
@@ -1,8 +1,15 @@
-from typing import List, Tuple
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from typing import Dict, List, Optional, Tuple
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer
 from normalizer import normalize
+import transformers
 import torch
+import json
 import logging
+import os
+import shutil
+import tempfile
+import time
+from ..config import Config
 
 # Configure logging
 logging.basicConfig(
@@ -11,31 +18,168 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# "torch" runs the fp32 model; "int8" and "onnx" are CPU-optimized backends
+TRANSLATION_BACKENDS = ("torch", "int8", "onnx")
+BN_EN_MODEL = "csebuetnlp/banglat5_nmt_bn_en"
+EN_BN_MODEL = "csebuetnlp/banglat5_nmt_en_bn"
+ONNX_COMPLETE_MARKER = "export_complete.json"
+
 
 class TranslationModel:
     """Manages loading and configuration of translation models and tokenizers."""
 
-    def __init__(self, model_name: str, use_fast: bool = False):
+    def __init__(
+            self,
+            model_name: str,
+            use_fast: bool = False,
+            backend: Optional[str] = None,
+            cache_dir: Optional[str] = None,
+            device: Optional[str] = None
+    ):
         """
         Initialize the translation model and tokenizer.
 
         Args:
             model_name (str): Hugging Face model name (e.g., 'csebuetnlp/banglat5_nmt_bn_en').
             use_fast (bool): Whether to use fast tokenizer. Defaults to False.
+            backend (Optional[str]): One of 'torch' (fp32), 'int8' (dynamic int8 quantization)
+                or 'onnx' (ONNX Runtime export). The last two always run on CPU.
+                Defaults to ``Config.TRANSLATION_BACKEND``.
+            cache_dir (Optional[str]): Directory where quantized or exported models are
+                cached. Defaults to ``Config.TRANSLATION_CACHE_DIR``.
+            device (Optional[str]): Device for the 'torch' backend. Defaults to CUDA when available.
 
         Raises:
+            ValueError: If the backend is unknown.
             RuntimeError: If model or tokenizer loading fails.
         """
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        logger.info(f"Using device: {self.device}")
+        backend = backend or Config.TRANSLATION_BACKEND
+        cache_dir = cache_dir or Config.TRANSLATION_CACHE_DIR
+        if backend not in TRANSLATION_BACKENDS:
+            logger.error(f"Unknown translation backend: {backend}")
+            raise ValueError(f"Backend must be one of {TRANSLATION_BACKENDS}")
+
+        self.model_name = model_name
+        self.backend = backend
+        self.cache_path = os.path.join(cache_dir, model_name.replace("/", "--"), backend)
+        if backend != "torch":
+            self.device = torch.device("cpu")
+        elif device is not None:
+            self.device = torch.device(device)
+        else:
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        logger.info(f"Using device: {self.device} ({backend} backend)")
 
         try:
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(self.device)
+            if backend == "int8":
+                self.model = self._load_int8_model()
+            elif backend == "onnx":
+                self.model = self._load_onnx_model()
+            else:
+                self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(self.device)
             self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=use_fast)
         except Exception as e:
             logger.error(f"Failed to load model or tokenizer for {model_name}: {str(e)}")
             raise RuntimeError(f"Model loading failed: {str(e)}")
 
+    def _cache_version(self) -> Dict[str, str]:
+        """Key identifying the library versions a cached model was built with."""
+        return {
+            "model_name": self.model_name,
+            "torch": str(torch.__version__),
+            "transformers": str(transformers.__version__),
+        }
+
+    def _load_int8_model(self) -> torch.nn.Module:
+        """
+        Load the model with its Linear layers dynamically quantized to int8.
+
+        The quantized ``state_dict`` is cached on first use together with a
+        version key. Later loads rebuild the quantized module from the model
+        config and restore the cached weights, skipping the fp32 download.
+        A cache written by other library versions is rebuilt.
+
+        Returns:
+            torch.nn.Module: Quantized model in eval mode on CPU.
+        """
+        weights_path = os.path.join(self.cache_path, "model_int8.pt")
+        version = self._cache_version()
+
+        if os.path.exists(weights_path):
+            try:
+                cached = torch.load(weights_path, map_location="cpu", weights_only=True)
+                if cached.get("version") == version:
+                    config = AutoConfig.from_pretrained(self.model_name)
+                    model = AutoModelForSeq2SeqLM.from_config(config).eval()
+                    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+                    model.load_state_dict(cached["state_dict"])
+                    logger.info(f"Loaded cached int8 model from {weights_path}")
+                    return model
+                logger.info(f"Cached int8 model at {weights_path} is stale, rebuilding")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable int8 cache {weights_path}: {str(e)}")
+
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name).eval()
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        os.makedirs(self.cache_path, exist_ok=True)
+        # Write to a temp file and rename so an interrupted save never leaves a partial cache
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                torch.save({"version": version, "state_dict": model.state_dict()}, f)
+            os.replace(tmp_path, weights_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        logger.info(f"Cached int8 model to {weights_path}")
+        return model
+
+    def _load_onnx_model(self):
+        """
+        Load an ONNX Runtime export of the model, exporting it on first use.
+
+        The export is written to a temporary directory and renamed into place
+        once complete. A cache is only reused if its completion marker matches
+        the current version key.
+
+        Returns:
+            ORTModelForSeq2SeqLM: ONNX Runtime model exposing ``generate``.
+
+        Raises:
+            ImportError: If optimum[onnxruntime] is not installed.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError:
+            raise ImportError("The 'onnx' backend requires optimum[onnxruntime]")
+
+        marker_path = os.path.join(self.cache_path, ONNX_COMPLETE_MARKER)
+        version = self._cache_version()
+        if os.path.exists(marker_path):
+            with open(marker_path, "r", encoding="utf-8") as f:
+                if json.load(f) == version:
+                    logger.info(f"Loaded cached ONNX model from {self.cache_path}")
+                    return ORTModelForSeq2SeqLM.from_pretrained(self.cache_path)
+            logger.info(f"Cached ONNX model at {self.cache_path} is stale, re-exporting")
+
+        parent_dir = os.path.dirname(self.cache_path)
+        os.makedirs(parent_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent_dir, prefix=".onnx-export-")
+        try:
+            model = ORTModelForSeq2SeqLM.from_pretrained(self.model_name, export=True)
+            model.save_pretrained(tmp_dir)
+            with open(os.path.join(tmp_dir, ONNX_COMPLETE_MARKER), "w", encoding="utf-8") as f:
+                json.dump(version, f)
+            if os.path.exists(self.cache_path):
+                shutil.rmtree(self.cache_path)
+            os.rename(tmp_dir, self.cache_path)
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+        logger.info(f"Exported ONNX model to {self.cache_path}")
+        # Reload from the final location so the session points at the cached files
+        return ORTModelForSeq2SeqLM.from_pretrained(self.cache_path)
+
     def translate_batch(
             self, sentences: List[str], max_tokens: int = 128
     ) -> List[str]:
@@ -95,10 +239,16 @@ class TranslationModel:
         return translations
 
 
-def load_translation_models() -> Tuple[TranslationModel, TranslationModel]:
+def load_translation_models(
+        backend: Optional[str] = None
+) -> Tuple[TranslationModel, TranslationModel]:
     """
     Load Bangla-to-English and English-to-Bangla translation models.
 
+    Args:
+        backend (Optional[str]): Inference backend, see ``TRANSLATION_BACKENDS``.
+            Defaults to ``Config.TRANSLATION_BACKEND``.
+
     Returns:
         Tuple[TranslationModel, TranslationModel]: Bangla-to-English and English-to-Bangla models.
 
@@ -106,8 +256,8 @@ def load_translation_models() -> Tuple[TranslationModel, TranslationModel]:
         RuntimeError: If any model fails to load.
     """
     try:
-        bn_to_en = TranslationModel("csebuetnlp/banglat5_nmt_bn_en", use_fast=False)
-        en_to_bn = TranslationModel("csebuetnlp/banglat5_nmt_en_bn", use_fast=False)
+        bn_to_en = TranslationModel(BN_EN_MODEL, use_fast=False, backend=backend)
+        en_to_bn = TranslationModel(EN_BN_MODEL, use_fast=False, backend=backend)
         return bn_to_en, en_to_bn
     except Exception as e:
         logger.error(f"Failed to load translation models: {str(e)}")
@@ -152,6 +302,95 @@ def translate_en_to_bn_batch(sentences: List[str], max_tokens: int = 128) -> Lis
     return en_to_bn_model.translate_batch(sentences, max_tokens)
 
 
+def check_backend_parity(
+        backend: str,
+        model_name: str = BN_EN_MODEL,
+        sentences: Optional[List[str]] = None,
+        batch_size: int = 16,
+        max_tokens: int = 128
+) -> Dict:
+    """
+    Compare a CPU-optimized backend against the fp32 model on the same sentences.
+
+    Drift is measured as BLEU/chrF of the backend's translations scored against
+    the fp32 translations, so 100 means identical output. Both models run on
+    CPU, each after one untimed warm-up batch, so the reported speedup reflects
+    steady-state throughput on the evaluation hosts.
+
+    Args:
+        backend (str): Backend to check ('int8' or 'onnx').
+        model_name (str): Hugging Face model name.
+        sentences (Optional[List[str]]): Source sentences. Defaults to the Bangla
+            ``input_text`` column of the bundled dimension CSVs for the bn_en model,
+            and to their fp32 bn_en English translations for the en_bn model.
+        batch_size (int): Number of sentences translated per batch.
+        max_tokens (int): Maximum number of tokens to generate per sentence.
+
+    Returns:
+        Dict: BLEU, chrF, per-backend wall-clock seconds and speedup.
+
+    Raises:
+        ValueError: If no sentences are given for a model other than bn_en or en_bn.
+        ImportError: If sacrebleu is not installed.
+        RuntimeError: If model loading or translation fails.
+    """
+    if sentences is None and model_name not in (BN_EN_MODEL, EN_BN_MODEL):
+        raise ValueError(f"No default parity sentences for '{model_name}', pass sentences explicitly")
+
+    import sacrebleu
+
+    if sentences is None:
+        from ..data.loader import DatasetLoader
+        loader = DatasetLoader()
+        sentences = [
+            text
+            for name in loader.list_datasets()
+            for text in loader.get_dataset(name)["input_text"].dropna().astype(str)
+            if text.strip()
+        ]
+        if model_name == EN_BN_MODEL:
+            # The bundled CSVs are Bangla, so feed en_bn the fp32 English translations
+            bn_to_en = TranslationModel(BN_EN_MODEL, backend="torch", device="cpu")
+            sentences = [
+                text
+                for i in range(0, len(sentences), batch_size)
+                for text in bn_to_en.translate_batch(sentences[i:i + batch_size], max_tokens)
+                if text.strip()
+            ]
+            del bn_to_en
+
+    def timed_translate(model: TranslationModel) -> Tuple[List[str], float]:
+        # One untimed warm-up batch so neither model is timed cold
+        model.translate_batch(sentences[:batch_size], max_tokens)
+        start = time.perf_counter()
+        outputs = []
+        for i in range(0, len(sentences), batch_size):
+            outputs.extend(model.translate_batch(sentences[i:i + batch_size], max_tokens))
+        return outputs, time.perf_counter() - start
+
+    reference_model = TranslationModel(model_name, backend="torch", device="cpu")
+    reference, reference_seconds = timed_translate(reference_model)
+    del reference_model
+
+    candidate, candidate_seconds = timed_translate(TranslationModel(model_name, backend=backend))
+
+    report = {
+        "model_name": model_name,
+        "backend": backend,
+        "sentences": len(sentences),
+        "bleu": sacrebleu.corpus_bleu(candidate, [reference]).score,
+        "chrf": sacrebleu.corpus_chrf(candidate, [reference]).score,
+        "fp32_seconds": reference_seconds,
+        "backend_seconds": candidate_seconds,
+        "speedup": reference_seconds / candidate_seconds if candidate_seconds else float("inf")
+    }
+    logger.info(
+        f"{backend} vs fp32 on {len(sentences)} sentences: BLEU {report['bleu']:.2f}, "
+        f"chrF {report['chrf']:.2f}, speedup {report['speedup']:.2f}x"
+    )
+    return report
+
+
 if __name__ == "__main__":
     # Example usage
     try:
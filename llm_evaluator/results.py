@@ -0,0 +1,240 @@
+from typing import Dict, Iterable, List, Optional, Union
+import logging
+import os
+import numpy as np
+from .config import Config
+from .utils import Utils
+
+logging.basicConfig(level=Config.LOG_LEVEL)
+
+
+class ResultStore:
+    """Compact store of evaluation results as a float32 (rows x dimensions) array.
+
+    Columns are fixed to ``Config.EVALUATION_DIMENSIONS`` followed by
+    ``final_score``. Rows appended without an ID are identified by their
+    position, which costs nothing. Explicit row IDs are interned: each row
+    keeps a uint32 code into a table of unique IDs, so repeated IDs are
+    stored once and a row costs its floats plus four bytes.
+    Slices and per-dimension columns are numpy views, not copies; slices
+    cannot be appended to.
+    """
+
+    columns = Config.EVALUATION_DIMENSIONS + ["final_score"]
+
+    def __init__(self, capacity: int = 1024):
+        self.logger = logging.getLogger(__name__)
+        self._scores = np.empty((capacity, len(self.columns)), dtype=np.float32)
+        # None while every row is identified by its position
+        self._codes: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._id_codes: Dict[str, int] = {}
+        self._positions: Optional[range] = None
+        self._size = 0
+        self._is_view = False
+        self._warned_columns = set()
+        self._column_index = {name: i for i, name in enumerate(self.columns)}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def scores(self) -> np.ndarray:
+        """View of the populated (rows x columns) score array"""
+        return self._scores[:self._size]
+
+    @property
+    def row_ids(self) -> List[str]:
+        if self._codes is None:
+            return [str(i) for i in self._position_range()]
+        return [self._ids[code] for code in self._codes[:self._size].tolist()]
+
+    def _position_range(self) -> range:
+        return self._positions if self._positions is not None else range(self._size)
+
+    def index_of(self, row_id: str) -> int:
+        """Return the position of the first row with ``row_id``"""
+        row_id = str(row_id)
+        if self._codes is None:
+            try:
+                return self._position_range().index(int(row_id))
+            except ValueError:
+                raise KeyError(f"Row '{row_id}' not found.")
+        code = self._id_codes.get(row_id)
+        matches = np.flatnonzero(self._codes[:self._size] == code) if code is not None else []
+        if not len(matches):
+            raise KeyError(f"Row '{row_id}' not found.")
+        return int(matches[0])
+
+    def _intern(self, row_id: str) -> int:
+        row_id = str(row_id)
+        code = self._id_codes.get(row_id)
+        if code is None:
+            code = len(self._ids)
+            self._ids.append(row_id)
+            self._id_codes[row_id] = code
+        return code
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= len(self._scores):
+            return
+        capacity = max(needed, 2 * len(self._scores))
+        scores = np.empty((capacity, len(self.columns)), dtype=np.float32)
+        scores[:self._size] = self._scores[:self._size]
+        self._scores = scores
+        if self._codes is not None:
+            codes = np.empty(capacity, dtype=np.uint32)
+            codes[:self._size] = self._codes[:self._size]
+            self._codes = codes
+
+    def _materialize_ids(self):
+        """Switch from positional to interned IDs, keeping earlier rows' positions as their IDs"""
+        self._codes = np.empty(len(self._scores), dtype=np.uint32)
+        for position in range(self._size):
+            self._codes[position] = self._intern(str(position))
+
+    def _warn_unknown(self, names: Iterable[str]):
+        new = [name for name in names if name not in self._warned_columns]
+        if new:
+            self._warned_columns.update(new)
+            self.logger.warning(f"Ignoring unknown result columns: {new}")
+
+    def append(self, result: Dict, row_id: Optional[str] = None):
+        """Append one result dict as returned by LLMEvaluator.evaluate"""
+        if self._is_view:
+            raise ValueError("Cannot append to a ResultStore slice.")
+        self._reserve(1)
+        row = self._scores[self._size]
+        row[:] = np.nan
+        for name, score in result.items():
+            index = self._column_index.get(name)
+            if index is None:
+                self._warn_unknown([name])
+                continue
+            row[index] = score
+        if row_id is not None and self._codes is None and str(row_id) != str(self._size):
+            self._materialize_ids()
+        if self._codes is not None:
+            self._codes[self._size] = self._intern(row_id if row_id is not None else str(self._size))
+        self._size += 1
+
+    def extend(self, results: Iterable[Dict], row_ids: Optional[Iterable[str]] = None):
+        results = list(results)
+        if row_ids is None:
+            for result in results:
+                self.append(result)
+            return
+        row_ids = list(row_ids)
+        if len(row_ids) != len(results):
+            raise ValueError(f"Got {len(results)} results but {len(row_ids)} row IDs.")
+        for result, row_id in zip(results, row_ids):
+            self.append(result, row_id)
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a single dimension's scores"""
+        if name not in self._column_index:
+            raise ValueError(f"Unknown result column '{name}'.")
+        return self._scores[:self._size, self._column_index[name]]
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict, "ResultStore"]:
+        if isinstance(key, slice):
+            view = ResultStore.__new__(ResultStore)
+            view.logger = self.logger
+            view._scores = self._scores[:self._size][key]
+            if self._codes is None:
+                view._codes = None
+                view._positions = self._position_range()[key]
+            else:
+                view._codes = self._codes[:self._size][key]
+                view._positions = None
+            # Views cannot append, so sharing the ID table is safe
+            view._ids = self._ids
+            view._id_codes = self._id_codes
+            view._size = len(view._scores)
+            view._is_view = True
+            view._warned_columns = set()
+            view._column_index = self._column_index
+            return view
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("ResultStore index out of range")
+        return dict(zip(self.columns, self._scores[key].tolist()))
+
+    @classmethod
+    def _from_arrays(cls, scores: np.ndarray, row_ids: Optional[List[str]] = None) -> "ResultStore":
+        """Build a store from a (rows x columns) array and optional row IDs in one step"""
+        size = len(scores)
+        store = cls(capacity=max(size, 1))
+        store._scores[:size] = scores
+        store._size = size
+        if row_ids is not None and [str(row_id) for row_id in row_ids] != [str(i) for i in range(size)]:
+            store._codes = np.empty(len(store._scores), dtype=np.uint32)
+            store._codes[:size] = [store._intern(row_id) for row_id in row_ids]
+        return store
+
+    def to_dict(self) -> Dict:
+        """Convert to the {row_id: {dimension: score}} layout used by Utils.save_results"""
+        row_ids = self.row_ids
+        if len(set(row_ids)) != len(row_ids):
+            raise ValueError("Row IDs must be unique to convert results to a dict.")
+        return {
+            row_id: dict(zip(self.columns, row))
+            for row_id, row in zip(row_ids, self.scores.tolist())
+        }
+
+    @classmethod
+    def from_dict(cls, results: Dict) -> "ResultStore":
+        unknown = {name for result in results.values() for name in result} - set(cls.columns)
+        scores = np.array(
+            [[result.get(name, np.nan) for name in cls.columns] for result in results.values()],
+            dtype=np.float32
+        ).reshape(len(results), len(cls.columns))
+        store = cls._from_arrays(scores, list(results.keys()))
+        store._warn_unknown(sorted(unknown))
+        return store
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.scores, index=pd.Index(self.row_ids, name="row_id"), columns=self.columns)
+
+    @classmethod
+    def from_dataframe(cls, df) -> "ResultStore":
+        scores = df.reindex(columns=cls.columns).to_numpy(np.float32)
+        store = cls._from_arrays(scores, df.index.astype(str).tolist())
+        store._warn_unknown([name for name in df.columns if name not in store._column_index])
+        return store
+
+    def save(self, filename: str):
+        """Save as JSON (.json) or compressed numpy arrays (.npz)"""
+        if filename.endswith(".npz"):
+            path = os.path.join(Config.OUTPUT_DIR, filename)
+            arrays = {"scores": self.scores, "columns": np.array(self.columns)}
+            if self._codes is not None:
+                arrays["codes"] = self._codes[:self._size]
+                arrays["ids"] = np.array(self._ids, dtype=str)
+            elif self._positions is not None:
+                arrays["positions"] = np.array(self._positions, dtype=np.int64)
+            np.savez_compressed(path, **arrays)
+            self.logger.info(f"Results saved to {path}")
+        else:
+            Utils.save_results(self.to_dict(), filename)
+
+    @classmethod
+    def load(cls, filename: str) -> "ResultStore":
+        if not filename.endswith(".npz"):
+            return cls.from_dict(Utils.load_results(filename))
+        with np.load(os.path.join(Config.OUTPUT_DIR, filename)) as data:
+            if list(data["columns"]) != cls.columns:
+                raise ValueError(f"Result columns in '{filename}' do not match Config.EVALUATION_DIMENSIONS.")
+            store = cls._from_arrays(data["scores"])
+            if "codes" in data:
+                store._ids = data["ids"].tolist()
+                store._id_codes = {row_id: code for code, row_id in enumerate(store._ids)}
+                store._codes = np.empty(len(store._scores), dtype=np.uint32)
+                store._codes[:store._size] = data["codes"]
+            elif "positions" in data:
+                store._codes = np.empty(len(store._scores), dtype=np.uint32)
+                store._codes[:store._size] = [store._intern(str(p)) for p in data["positions"].tolist()]
+        return store
@@ -0,0 +1,167 @@
+import math
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from llm_evaluator.adaptive import AdaptiveEvaluator, RunningStats, t_quantile
+from llm_evaluator.config import Config
+from llm_evaluator.data.loader import DatasetLoader
+from llm_evaluator.scoring import Scorer
+
+
+class StubEvaluator:
+    def __init__(self, score=lambda conversation, dimension: 1.0):
+        self.score = score
+        self.scorer = Scorer()
+        self.calls = []
+
+    def evaluate_dimension(self, conversation, dimension):
+        self.calls.append((dimension, conversation))
+        return self.score(conversation, dimension)
+
+
+class StubGenerate:
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompt):
+        self.prompts.append(prompt)
+        return "x"
+
+
+@pytest.fixture
+def loader(tmp_path):
+    for dataset in Config.DIMENSION_DATASETS.values():
+        pd.DataFrame({
+            "input_text": [f"প্রশ্ন {'অ' * (i % 7)} {i}" for i in range(40)],
+            "reference": [f"উত্তর {i}" for i in range(40)],
+        }).to_csv(tmp_path / f"{dataset}.csv", index=False)
+    return DatasetLoader(str(tmp_path))
+
+
+def make_evaluator(loader, evaluator=None, **kwargs):
+    generate = StubGenerate()
+    adaptive = AdaptiveEvaluator(generate, evaluator=evaluator or StubEvaluator(), loader=loader, seed=0, **kwargs)
+    return adaptive, generate
+
+
+@pytest.mark.parametrize("df,p,expected", [(1, 0.975, 12.706), (4, 0.975, 2.776), (30, 0.975, 2.042), (5, 0.995, 4.032)])
+def test_t_quantile(df, p, expected):
+    assert t_quantile(p, df) == pytest.approx(expected, abs=1e-3)
+
+
+def test_running_stats_uses_sample_variance_with_floor():
+    stats = RunningStats(confidence=0.95, variance_floor=0.01)
+    assert stats.mean is None
+    assert stats.interval == (0.0, 1.0)
+    stats.add(1.0)
+    assert stats.interval == (0.0, 1.0)
+    assert math.isinf(stats.half_width)
+    for _ in range(9):
+        stats.add(1.0)
+    # Identical scores keep a nonzero margin from the variance floor
+    assert stats.margin == pytest.approx(t_quantile(0.975, 9) * math.sqrt(0.01 / 10))
+    assert stats.interval[1] == 1.0
+
+    mixed = RunningStats(confidence=0.95, variance_floor=0.0)
+    for value in [0.2, 0.4, 0.6, 0.8]:
+        mixed.add(value)
+    variance = sum((v - 0.5) ** 2 for v in [0.2, 0.4, 0.6, 0.8]) / 3
+    assert mixed.mean == pytest.approx(0.5)
+    assert mixed.half_width == pytest.approx(t_quantile(0.975, 3) * math.sqrt(variance / 4))
+
+
+def test_length_strata_cover_all_rows(loader):
+    adaptive, _ = make_evaluator(loader, length_buckets=4)
+    df = loader.get_dataset("conversation_fluency")
+    groups = adaptive.strata(df)
+    assert len(groups) == 4
+    assert sorted(i for g in groups for i in g) == list(df.index)
+    lengths = df["input_text"].str.len()
+    # Buckets are ordered quantiles of input length
+    assert max(lengths[groups[0]]) <= min(lengths[groups[-1]])
+
+
+def test_strata_column_keeps_missing_values(loader):
+    df = pd.DataFrame({
+        "input_text": ["a", "b", "c", "d"],
+        "reference": ["", "", "", ""],
+        "topic": ["x", None, "y", None],
+    })
+    adaptive, _ = make_evaluator(loader, strata_column="topic")
+    groups = adaptive.strata(df)
+    assert sorted(map(sorted, groups)) == [[0], [1, 3], [2]]
+
+
+def test_missing_strata_column_raises(loader):
+    adaptive, _ = make_evaluator(loader, strata_column="topci")
+    with pytest.raises(ValueError):
+        adaptive.strata(loader.get_dataset("conversation_fluency"))
+
+
+def test_sample_order_is_seeded_permutation(loader):
+    df = loader.get_dataset("conversation_fluency")
+    first, _ = make_evaluator(loader)
+    second, _ = make_evaluator(loader)
+    order = first.sample_order(df)
+    assert order == second.sample_order(df)
+    assert sorted(order) == list(df.index)
+    assert order != list(df.index)
+
+
+def test_constant_scores_converge_early(loader):
+    adaptive, generate = make_evaluator(loader, tolerance=0.1)
+    report = adaptive.evaluate_dimension("conversation_fluency")
+    assert report.stop_reason == "converged"
+    assert report.score == 1.0
+    assert 2 <= report.rows_evaluated < report.rows_available
+    assert report.ci_low < 1.0
+    assert len(generate.prompts) == report.rows_evaluated
+
+
+def test_budget_stops_dimension(loader):
+    evaluator = StubEvaluator(lambda conversation, dimension: len(conversation["input_text"]) % 2)
+    adaptive, generate = make_evaluator(loader, evaluator=evaluator, tolerance=0.01, max_calls=7)
+    report = adaptive.evaluate_dimension("conversation_fluency")
+    assert report.stop_reason == "budget"
+    assert report.rows_evaluated == 7
+    assert len(generate.prompts) == 7
+
+
+def test_exhausted_when_tolerance_unreachable(loader):
+    evaluator = StubEvaluator(lambda conversation, dimension: len(conversation["input_text"]) % 2)
+    adaptive, _ = make_evaluator(loader, evaluator=evaluator, tolerance=0.01)
+    report = adaptive.evaluate_dimension("conversation_fluency")
+    assert report.stop_reason == "exhausted"
+    assert report.rows_evaluated == report.rows_available == 40
+
+
+def test_zero_budget_reports_missing_score(loader):
+    adaptive, generate = make_evaluator(loader, max_calls=0)
+    report = adaptive.evaluate_dimension("conversation_fluency")
+    assert report.score is None
+    assert (report.ci_low, report.ci_high) == (0.0, 1.0)
+    assert generate.prompts == []
+
+
+def test_conversation_fields_per_dimension(loader):
+    evaluator = StubEvaluator()
+    adaptive, _ = make_evaluator(loader, evaluator=evaluator, max_calls=1)
+    adaptive.evaluate_dimension("edge_case_handling")
+    adaptive.evaluate_dimension("special_instruction_adherence")
+    (_, edge), (_, instruction) = evaluator.calls
+    assert edge["is_edge_case"] is True
+    assert instruction["instructions"] == instruction["input_text"]
+
+
+def test_evaluate_skips_unscorable_and_applies_bonferroni(loader):
+    adaptive, generate = make_evaluator(loader, confidence=0.95)
+    report = adaptive.evaluate()
+    tool = report["dimensions"]["tool_calling_performance"]
+    assert tool["stop_reason"] == "unscorable"
+    assert tool["score"] is None
+    scorable = len(Config.EVALUATION_DIMENSIONS) - 1
+    assert report["dimension_confidence"] == pytest.approx(1 - 0.05 / scorable)
+    assert report["final_score"] == pytest.approx(1.0)
+    assert 0 < report["final_score_margin"] < 0.1
+    assert report["rows_evaluated"] == len(generate.prompts)
@@ -0,0 +1,62 @@
+import pytest
+from llm_evaluator.guardrails import StreamingGuardrails
+
+PHRASE = "ঘৃণা"
+TEXT = f"আমি {PHRASE} করি না, {PHRASE} ভালো নয়"
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def expected_offsets(text, phrase):
+    offsets, start = [], text.find(phrase)
+    while start != -1:
+        offsets.append(start)
+        start = text.find(phrase, start + 1)
+    return offsets
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_phrase_split_across_chunks(size):
+    matcher = StreamingGuardrails()
+    for chunk in chunked(TEXT, size):
+        matcher.feed(chunk)
+    assert [v.offset for v in matcher.violations] == expected_offsets(TEXT, PHRASE)
+    assert all(v.phrase == PHRASE and v.matched_text == PHRASE for v in matcher.violations)
+    assert matcher.text == TEXT
+
+
+def test_feed_returns_violation_on_completing_chunk():
+    matcher = StreamingGuardrails()
+    assert matcher.feed("আমি ঘৃ") is None
+    violation = matcher.feed("ণা")
+    assert violation is not None
+    assert violation.offset == len("আমি ")
+
+
+def test_carried_tail_is_not_reported_twice():
+    matcher = StreamingGuardrails()
+    matcher.feed(f"x {PHRASE}")
+    # The phrase sits entirely in the carried tail for the next chunks
+    assert matcher.feed("y") is None
+    assert matcher.feed("z") is None
+    assert len(matcher.violations) == 1
+
+
+def test_reset_clears_state():
+    matcher = StreamingGuardrails()
+    matcher.feed("ঘৃ")
+    matcher.reset()
+    # A stale tail would complete the phrase from the previous stream
+    assert matcher.feed("ণা") is None
+    assert not matcher.violated
+    assert matcher.text == "ণা"
+    assert matcher.feed(PHRASE).offset == 2
+
+
+def test_clean_stream_scores_full_compliance():
+    matcher = StreamingGuardrails()
+    for chunk in chunked("আমি ভালো আছি", 2):
+        assert matcher.feed(chunk) is None
+    assert matcher.score() == 1.0
@@ -0,0 +1,158 @@
+import json
+import pytest
+from llm_evaluator.guardrails import StreamingGuardrails
+
+PHRASE = "ঘৃণা"
+
+
+class FakeStreamResponse:
+    def __init__(self, chunks, content_type):
+        self.chunks = chunks
+        self.headers = {"Content-Type": content_type}
+        self.consumed = 0
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+@pytest.fixture
+def api(monkeypatch):
+    requests = pytest.importorskip("requests")
+    from llm_evaluator.models import llm_api
+
+    def serve(chunks, content_type):
+        response = FakeStreamResponse(chunks, content_type)
+        monkeypatch.setattr(requests, "post", lambda *args, **kwargs: response)
+        return llm_api.LLMApi("http://test"), response
+
+    return serve
+
+
+def test_stream_response_sse_framing(api):
+    events = [
+        'data: {"choices": [{"delta": {"content": "আমি "}}]}\n\n',
+        'event: ping\n: keep-alive\n\n',
+        'data: {"choices": [{"delta": {"content": "ভালো"}}]}\n\n',
+        'data: [DONE]\n\n',
+        'data: {"choices": [{"delta": {"content": "ignored"}}]}\n\n',
+    ]
+    client, response = api([e.encode("utf-8") for e in events], "text/event-stream")
+    result = client.stream_response("prompt")
+    assert result == {"text": "আমি ভালো", "aborted": False, "violation": None}
+    assert response.closed
+
+
+def test_stream_response_ndjson_split_across_chunks(api):
+    body = "".join(json.dumps({"response": t}) + "\n" for t in ["আমি ", "ঘৃ", "ণা", " করি"]).encode("utf-8")
+    # Split inside multi-byte characters and JSON lines
+    client, _ = api([body[i:i + 5] for i in range(0, len(body), 5)], "application/x-ndjson")
+    result = client.stream_response("prompt")
+    assert result["aborted"]
+    assert result["violation"]["offset"] == len("আমি ")
+    assert result["text"].endswith(PHRASE)
+
+
+def test_stream_response_plain_bangla_without_charset(api):
+    # requests would decode text/* without a charset as ISO-8859-1
+    client, _ = api([f"আমি {PHRASE}".encode("utf-8")], "text/plain")
+    result = client.stream_response("prompt")
+    assert result["violation"]["phrase"] == PHRASE
+
+
+def test_stream_response_explicit_charset(api):
+    client, _ = api(["café".encode("latin-1")], "text/plain; charset=ISO-8859-1")
+    assert client.stream_response("prompt")["text"] == "café"
+
+
+def test_stream_response_aborts_midway(api):
+    chunks = ["আমি ", "ঘৃ", "ণা", " আরও", " অনেক", " লেখা"]
+    client, response = api([c.encode("utf-8") for c in chunks], "text/plain")
+    result = client.stream_response("prompt")
+    assert result["aborted"]
+    assert result["text"] == f"আমি {PHRASE}"
+    assert response.consumed == 3
+    assert response.closed
+
+
+def test_decode_stream_line_keeps_non_dict_json(api):
+    from llm_evaluator.models.llm_api import LLMApi
+    assert LLMApi._decode_stream_line("42") == "42\n"
+    assert LLMApi._decode_stream_line("null") == "null\n"
+    assert LLMApi._decode_stream_line('"text"') == "text"
+    assert LLMApi._decode_stream_line("plain") == "plain\n"
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self.chunks)
+        self.consumed += 1
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeLlm:
+    def __init__(self, chunks):
+        self.stream_obj = FakeStream(chunks)
+
+    def stream(self, prompt):
+        return self.stream_obj
+
+
+@pytest.fixture
+def llama_model():
+    pytest.importorskip("torch")
+    pytest.importorskip("langchain_community")
+    pytest.importorskip("huggingface_hub")
+    from llm_evaluator.models.llama_cpp import LlamaModel
+
+    def build(chunks):
+        model = LlamaModel.__new__(LlamaModel)
+        model.llm = FakeLlm(chunks)
+        return model
+
+    return build
+
+
+def test_generate_stream_closes_on_violation(llama_model):
+    model = llama_model(["আমি ", "ঘৃ", "ণা", " আরও", " লেখা"])
+    text, violation = model.generate_stream("prompt")
+    assert text == f"আমি {PHRASE}"
+    assert violation.offset == len("আমি ")
+    assert model.llm.stream_obj.consumed == 3
+    assert model.llm.stream_obj.closed
+
+
+def test_generate_stream_completes_without_violation(llama_model):
+    matcher = StreamingGuardrails()
+    model = llama_model(["আমি ", "ভালো ", "আছি"])
+    text, violation = model.generate_stream("prompt", guardrails=matcher)
+    assert (text, violation) == ("আমি ভালো আছি", None)
+    assert model.llm.stream_obj.closed
+    assert matcher.text == text
+
+
+def test_generate_stream_rejects_empty_prompt(llama_model):
+    with pytest.raises(ValueError):
+        llama_model([]).generate_stream("  ")
@@ -0,0 +1,151 @@
+import logging
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from llm_evaluator.config import Config
+from llm_evaluator.results import ResultStore
+
+COLUMNS = Config.EVALUATION_DIMENSIONS + ["final_score"]
+
+
+def result(value):
+    return {name: value for name in COLUMNS}
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_append_grows_and_keeps_rows():
+    store = ResultStore(capacity=2)
+    for i in range(5):
+        store.append(result(i / 10))
+    assert len(store) == 5
+    assert store.scores.dtype == np.float32
+    assert store.scores.shape == (5, len(COLUMNS))
+    assert store[4]["final_score"] == pytest.approx(0.4)
+    assert store[-1] == store[4]
+    assert store.row_ids == ["0", "1", "2", "3", "4"]
+    with pytest.raises(IndexError):
+        store[5]
+
+
+def test_missing_columns_are_nan_and_unknown_warned_once(caplog):
+    store = ResultStore()
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            store.append({"conversation_fluency": 0.5, "bogus": 1.0})
+    assert np.isnan(store.column("final_score")).all()
+    assert sum("bogus" in record.message for record in caplog.records) == 1
+
+
+def test_positional_ids_store_no_codes():
+    store = ResultStore()
+    store.extend([result(0.1), result(0.2)], row_ids=["0", 1])
+    assert store._codes is None
+    assert store.index_of("1") == 1
+
+
+def test_switch_to_explicit_ids_interns():
+    store = ResultStore(capacity=1)
+    store.append(result(0.1))
+    store.append(result(0.2), row_id="conv-a")
+    store.append(result(0.3), row_id="conv-a")
+    store.append(result(0.4), row_id=7)
+    store.append(result(0.5), row_id="7")
+    assert store.row_ids == ["0", "conv-a", "conv-a", "7", "7"]
+    assert store._codes.dtype == np.uint32
+    # Repeated IDs, including an int and its string form, share one table entry
+    assert store._ids == ["0", "conv-a", "7"]
+    assert store.index_of("conv-a") == 1
+    assert store.index_of(7) == 3
+    with pytest.raises(KeyError):
+        store.index_of("missing")
+
+
+def test_extend_rejects_length_mismatch():
+    store = ResultStore()
+    with pytest.raises(ValueError):
+        store.extend([result(0.1), result(0.2)], row_ids=["a"])
+    assert len(store) == 0
+
+
+def test_slices_and_columns_are_views():
+    store = ResultStore()
+    store.extend([result(i / 10) for i in range(6)])
+    column = store.column("guardrails_compliance")
+    assert np.shares_memory(column, store.scores)
+    view = store[1:6:2]
+    assert np.shares_memory(view.scores, store.scores)
+    assert view.row_ids == ["1", "3", "5"]
+    assert view[1:].row_ids == ["3", "5"]
+    assert view._positions is not None
+    assert view.index_of("3") == 1
+    with pytest.raises(ValueError):
+        view.append(result(0.0))
+    assert len(store) == 6
+
+
+def test_interned_slice_shares_codes():
+    store = ResultStore()
+    store.extend([result(0.1), result(0.2), result(0.3)], row_ids=["a", "b", "c"])
+    view = store[1:]
+    assert np.shares_memory(view._codes, store._codes)
+    assert view.row_ids == ["b", "c"]
+
+
+def test_to_dict_rejects_duplicate_ids():
+    store = ResultStore()
+    store.extend([result(0.1), result(0.2)], row_ids=["a", "a"])
+    with pytest.raises(ValueError):
+        store.to_dict()
+
+
+def test_dict_round_trip():
+    results = {"a": result(0.25), "b": {"conversation_fluency": 0.5}}
+    store = ResultStore.from_dict(results)
+    assert store.row_ids == ["a", "b"]
+    restored = store.to_dict()
+    assert restored["a"] == pytest.approx(result(0.25))
+    assert restored["b"]["conversation_fluency"] == 0.5
+    assert np.isnan(restored["b"]["final_score"])
+
+
+@pytest.mark.parametrize("filename", ["results.json", "results.npz"])
+@pytest.mark.parametrize("row_ids", [None, ["x", "y", "x2"]])
+def test_file_round_trip(output_dir, filename, row_ids):
+    store = ResultStore()
+    store.extend([result(0.1), result(0.2), result(0.3)], row_ids=row_ids)
+    store.save(filename)
+    loaded = ResultStore.load(filename)
+    assert loaded.row_ids == store.row_ids
+    np.testing.assert_allclose(loaded.scores, store.scores)
+
+
+def test_npz_round_trip_of_positional_slice(output_dir):
+    store = ResultStore()
+    store.extend([result(i / 10) for i in range(5)])
+    store[::2].save("slice.npz")
+    loaded = ResultStore.load("slice.npz")
+    assert loaded.row_ids == ["0", "2", "4"]
+    loaded.append(result(0.9), row_id="extra")
+    assert loaded.row_ids[-1] == "extra"
+
+
+def test_dataframe_round_trip():
+    pd = pytest.importorskip("pandas")
+    store = ResultStore()
+    store.extend([result(0.1), result(0.2)], row_ids=["a", "b"])
+    df = store.to_dataframe()
+    assert list(df.columns) == COLUMNS
+    assert list(df.index) == ["a", "b"]
+    restored = ResultStore.from_dataframe(df.assign(extra=1.0))
+    assert restored.row_ids == ["a", "b"]
+    np.testing.assert_allclose(restored.scores, store.scores)
+
+    positional = ResultStore.from_dataframe(pd.DataFrame([result(0.5)] * 3))
+    assert positional._codes is None
+    assert positional.row_ids == ["0", "1", "2"]
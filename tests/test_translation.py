@@ -0,0 +1,119 @@
+import os
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("normalizer")
+
+from llm_evaluator.config import Config
+from llm_evaluator.models import translation
+
+
+class TinySeq2Seq(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.encoder = torch.nn.Linear(8, 8)
+        self.decoder = torch.nn.Linear(8, 4)
+
+    def forward(self, x):
+        return self.decoder(self.encoder(x))
+
+
+class StubAutoModel:
+    pretrained_calls = 0
+    config_calls = 0
+
+    @classmethod
+    def from_pretrained(cls, name):
+        cls.pretrained_calls += 1
+        torch.manual_seed(0)
+        return TinySeq2Seq()
+
+    @classmethod
+    def from_config(cls, config):
+        cls.config_calls += 1
+        torch.manual_seed(1)
+        return TinySeq2Seq()
+
+
+class StubLoader:
+    @staticmethod
+    def from_pretrained(*args, **kwargs):
+        return object()
+
+
+@pytest.fixture
+def stub_models(monkeypatch):
+    StubAutoModel.pretrained_calls = 0
+    StubAutoModel.config_calls = 0
+    monkeypatch.setattr(translation, "AutoModelForSeq2SeqLM", StubAutoModel)
+    monkeypatch.setattr(translation, "AutoConfig", StubLoader)
+    monkeypatch.setattr(translation, "AutoTokenizer", StubLoader)
+    return StubAutoModel
+
+
+def load_int8(cache_dir):
+    return translation.TranslationModel("org/model", backend="int8", cache_dir=str(cache_dir))
+
+
+def weights_path(cache_dir):
+    return os.path.join(str(cache_dir), "org--model", "int8", "model_int8.pt")
+
+
+def output(model):
+    torch.manual_seed(2)
+    with torch.no_grad():
+        return model.model(torch.randn(3, 8))
+
+
+def test_unknown_backend_rejected(stub_models, tmp_path):
+    with pytest.raises(ValueError):
+        translation.TranslationModel("org/model", backend="fp16", cache_dir=str(tmp_path))
+
+
+def test_backend_defaults_to_config(stub_models, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TRANSLATION_BACKEND", "int8")
+    monkeypatch.setattr(Config, "TRANSLATION_CACHE_DIR", str(tmp_path))
+    model = translation.TranslationModel("org/model")
+    assert model.backend == "int8"
+    assert model.device.type == "cpu"
+    assert os.path.exists(weights_path(tmp_path))
+
+
+def test_int8_cache_hit_skips_fp32_load(stub_models, tmp_path):
+    first = load_int8(tmp_path)
+    assert stub_models.pretrained_calls == 1
+    assert os.listdir(os.path.dirname(weights_path(tmp_path))) == ["model_int8.pt"]
+
+    second = load_int8(tmp_path)
+    assert stub_models.pretrained_calls == 1
+    assert stub_models.config_calls == 1
+    assert torch.equal(output(first), output(second))
+
+
+def test_int8_stale_version_rebuilds(stub_models, tmp_path):
+    load_int8(tmp_path)
+    cached = torch.load(weights_path(tmp_path), weights_only=True)
+    cached["version"]["torch"] = "0.0.0"
+    torch.save(cached, weights_path(tmp_path))
+
+    load_int8(tmp_path)
+    assert stub_models.pretrained_calls == 2
+    rewritten = torch.load(weights_path(tmp_path), weights_only=True)
+    assert rewritten["version"]["torch"] == torch.__version__
+
+
+def test_int8_unreadable_cache_rebuilds(stub_models, tmp_path):
+    os.makedirs(os.path.dirname(weights_path(tmp_path)))
+    with open(weights_path(tmp_path), "wb") as f:
+        f.write(b"not a checkpoint")
+
+    model = load_int8(tmp_path)
+    assert stub_models.pretrained_calls == 1
+    assert model.model is not None
+    torch.load(weights_path(tmp_path), weights_only=True)
+
+
+def test_parity_requires_sentences_for_unknown_model():
+    with pytest.raises(ValueError):
+        translation.check_backend_parity("int8", model_name="org/model")